@@ -1,11 +1,13 @@
 """Cache management with hash/mtime invalidation."""
 
 import hashlib
-import json
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from anki_gen.cache.models import (
     CachedBookStructure,
     CachedChapter,
@@ -14,6 +16,10 @@ from anki_gen.cache.models import (
 )
 from anki_gen.models.book import ParsedBook
 
+# Cache files are written as UTF-8 bytes straight from the serializer
+_INDEX_ADAPTER = TypeAdapter(CacheIndex)
+_STRUCTURE_ADAPTER = TypeAdapter(CachedBookStructure)
+
 
 class CacheManager:
     """Manages caching of parsed book structures (EPUB, PDF, etc.)."""
@@ -26,6 +32,8 @@ class CacheManager:
         self.cache_root = project_dir / self.CACHE_DIR
         self.index_path = self.cache_root / self.INDEX_FILE
         self._index: CacheIndex | None = None
+        # File hashes keyed by (resolved path, mtime_ns, size)
+        self._hashes: dict[tuple[str, int, int], str] = {}
 
     def _ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist."""
@@ -38,8 +46,9 @@ class CacheManager:
 
         if self.index_path.exists():
             try:
-                data = json.loads(self.index_path.read_text())
-                self._index = CacheIndex.model_validate(data)
+                self._index = CacheIndex.model_validate_json(
+                    self.index_path.read_bytes()
+                )
             except Exception:
                 self._index = CacheIndex()
         else:
@@ -51,38 +60,49 @@ class CacheManager:
         """Save cache index to disk."""
         self._ensure_cache_dir()
         index = self._load_index()
-        self.index_path.write_text(index.model_dump_json(indent=2))
+        self.index_path.write_bytes(_INDEX_ADAPTER.dump_json(index, indent=2))
 
     def get_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            # Python 3.11+ runs the read loop in C
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
-    def is_cache_valid(self, file_path: Path) -> bool:
-        """Check if cached data exists and is still valid."""
+    def _get_stat_hash(self, file_path: Path, stat: os.stat_result) -> str:
+        """Hash a file, reusing the result while its mtime and size are unchanged."""
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        file_hash = self._hashes.get(key)
+        if file_hash is None:
+            file_hash = self._hashes[key] = self.get_file_hash(file_path)
+        return file_hash
+
+    def _load_valid_structure(self, file_path: Path) -> CachedBookStructure | None:
+        """Load the cached structure for a file if it exists and is still valid."""
         if not self.cache_root.exists():
-            return False
+            return None
 
         index = self._load_index()
         path_key = str(file_path.resolve())
 
         if path_key not in index.entries:
-            return False
+            return None
 
         file_hash = index.entries[path_key]
         cache_file = self.cache_root / "books" / file_hash / "structure.json"
 
         if not cache_file.exists():
-            return False
+            return None
 
         # Load cached metadata
         try:
-            cached = CachedBookStructure.model_validate_json(cache_file.read_text())
+            cached = CachedBookStructure.model_validate_json(cache_file.read_bytes())
         except Exception:
-            return False
+            return None
 
         stat = file_path.stat()
 
@@ -91,37 +111,31 @@ class CacheManager:
             cached.cache_metadata.file_mtime == stat.st_mtime
             and cached.cache_metadata.file_size == stat.st_size
         ):
-            return True
+            return cached
 
         # Slow path: mtime changed, verify with hash
-        current_hash = self.get_file_hash(file_path)
+        current_hash = self._get_stat_hash(file_path, stat)
         if cached.cache_metadata.file_hash == current_hash:
             # File unchanged, update mtime in cache
             cached.cache_metadata.file_mtime = stat.st_mtime
-            cache_file.write_text(cached.model_dump_json(indent=2))
-            return True
+            cache_file.write_bytes(_STRUCTURE_ADAPTER.dump_json(cached, indent=2))
+            return cached
 
-        return False
+        return None
+
+    def is_cache_valid(self, file_path: Path) -> bool:
+        """Check if cached data exists and is still valid."""
+        return self._load_valid_structure(file_path) is not None
 
     def get_cached_structure(self, file_path: Path) -> CachedBookStructure | None:
         """Retrieve cached book structure if valid."""
-        if not self.is_cache_valid(file_path):
-            return None
-
-        index = self._load_index()
-        path_key = str(file_path.resolve())
-        file_hash = index.entries[path_key]
-        cache_file = self.cache_root / "books" / file_hash / "structure.json"
-
-        try:
-            return CachedBookStructure.model_validate_json(cache_file.read_text())
-        except Exception:
-            return None
+        return self._load_valid_structure(file_path)
 
     def save_structure(self, file_path: Path, parsed: ParsedBook) -> None:
         """Save parsed book structure to cache."""
         stat = file_path.stat()
-        file_hash = self.get_file_hash(file_path)
+        # Reuses the hash computed when a changed file failed validation
+        file_hash = self._get_stat_hash(file_path, stat)
 
         cache_metadata = CacheMetadata(
             file_path=str(file_path.resolve()),
@@ -164,7 +178,7 @@ class CacheManager:
         cache_dir = self.cache_root / "books" / file_hash
         cache_dir.mkdir(parents=True, exist_ok=True)
         cache_file = cache_dir / "structure.json"
-        cache_file.write_text(structure.model_dump_json(indent=2))
+        cache_file.write_bytes(_STRUCTURE_ADAPTER.dump_json(structure, indent=2))
 
         # Update index
         index = self._load_index()
@@ -323,6 +323,23 @@ def generate(
             help="Suppress progress output",
         ),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of sections to generate concurrently (disables live output)",
+            min=1,
+        ),
+    ] = 1,
+    sdk: Annotated[
+        bool,
+        typer.Option(
+            "--sdk",
+            help="Call the Gemini API via google-genai instead of the Gemini CLI "
+            "(requires GEMINI_API_KEY)",
+        ),
+    ] = False,
 ) -> None:
     """Generate AI-powered flashcards from parsed sections.
 
@@ -344,6 +361,8 @@ def generate(
             deck=deck,
             tags=tags,
             force=force,
+            use_sdk=sdk,
+            jobs=jobs,
         )
     except Exception as e:
         console.print(f"[red]Error: {e}[/]")
@@ -1,6 +1,8 @@
 """Export command implementation."""
 
+import os
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -8,8 +10,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from anki_gen.models.flashcard import AnkiExportConfig
 from anki_gen.models.output import BookOutput
 
+# Section number in chapter file names (chapter_011.json -> 011)
+_CHAPTER_NUM_RE = re.compile(r"chapter_(\d+)")
+# Card file names, as matched by the glob chapter_*_cards.txt
+_CARD_FILE_RE = re.compile(r"chapter_.*_cards\.txt", re.DOTALL)
+
 
 @dataclass
 class ChapterCards:
@@ -35,12 +43,17 @@ class ExportStats:
 
 def find_card_files(chapters_dir: Path) -> list[Path]:
     """Find all chapter card files in directory."""
-    return sorted(chapters_dir.glob("chapter_*_cards.txt"))
+    with os.scandir(chapters_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if _CARD_FILE_RE.fullmatch(entry.name)
+        )
 
 
 def extract_chapter_number(path: Path) -> int:
     """Extract chapter number from filename (chapter_011_cards.txt -> 11)."""
-    match = re.search(r"chapter_(\d+)", path.stem)
+    match = _CHAPTER_NUM_RE.search(path.stem)
     if match:
         return int(match.group(1))
     return 0
@@ -99,43 +112,57 @@ def load_manifest(chapters_dir: Path) -> BookOutput | None:
     manifest_path = chapters_dir / "manifest.json"
     if not manifest_path.exists():
         return None
-    return BookOutput.model_validate_json(manifest_path.read_text())
+    return BookOutput.model_validate_json(manifest_path.read_bytes())
 
 
-def build_combined_export(
+def iter_combined_export(
     chapters: list[ChapterCards],
     book_slug: str,
     global_tags: list[str] | None = None,
-) -> str:
-    """Build combined export file with per-card deck column.
+) -> Iterator[str]:
+    """Yield the combined export file in pieces (see build_combined_export).
 
-    Format:
-    - Headers with #deck column:6 to specify per-card deck
-    - Each card line has deck appended as 6th column
+    The headers come first as one piece, then each card line prefixed with
+    its newline, so the pieces concatenate to the full file.
     """
     # Build headers
     tags_str = f"anki-gen {book_slug}"
     if global_tags:
         tags_str += " " + " ".join(global_tags)
 
-    lines = [
-        "#separator:Pipe",
-        "#html:true",
-        f"#tags:{tags_str}",
-        "#notetype column:1",
-        "#tags column:4",
-        "#guid column:5",
-        "#deck column:6",
-        "#columns:Note Type|Field 1|Field 2|Tags|GUID|Deck",
-    ]
+    yield "\n".join(
+        [
+            "#separator:Pipe",
+            "#html:true",
+            f"#tags:{tags_str}",
+            "#notetype column:1",
+            "#tags column:4",
+            "#guid column:5",
+            "#deck column:6",
+            "#columns:Note Type|Field 1|Field 2|Tags|GUID|Deck",
+        ]
+    )
 
     # Add cards from each chapter with deck column
     for chapter in chapters:
+        deck_name = chapter.deck_name
         for card_line in chapter.card_lines:
             # Append deck name as 6th column
-            lines.append(f"{card_line}|{chapter.deck_name}")
+            yield f"\n{card_line}|{deck_name}"
 
-    return "\n".join(lines)
+
+def build_combined_export(
+    chapters: list[ChapterCards],
+    book_slug: str,
+    global_tags: list[str] | None = None,
+) -> str:
+    """Build combined export file with per-card deck column.
+
+    Format:
+    - Headers with #deck column:6 to specify per-card deck
+    - Each card line has deck appended as 6th column
+    """
+    return "".join(iter_combined_export(chapters, book_slug, global_tags))
 
 
 def calculate_stats(chapters: list[ChapterCards]) -> ExportStats:
@@ -246,19 +273,16 @@ def execute_export(
         console.print(f"[dim]Book:[/] {manifest.book_title}")
         console.print(f"[dim]Found {len(chapters)} section(s) with cards[/]")
 
-    # Build book slug for tags
-    book_slug = re.sub(r"[^a-z0-9-]", "", manifest.book_title.lower().replace(" ", "-"))
-    book_slug = re.sub(r"-+", "-", book_slug).strip("-")
-
-    # Build combined export
-    combined = build_combined_export(chapters, book_slug)
+    # Build book slug for tags (same slug generate uses in per-section files)
+    book_slug = AnkiExportConfig.slugify(manifest.book_title)
 
     # Determine output path
     if output_file is None:
         output_file = chapters_dir / "all_cards.txt"
 
-    # Write output
-    output_file.write_text(combined)
+    # Stream combined export to the file instead of building it in memory
+    with output_file.open("w", buffering=1 << 20) as f:
+        f.writelines(iter_combined_export(chapters, book_slug))
 
     # Display stats
     if not quiet:
@@ -4,14 +4,25 @@ import json
 import re
 from pathlib import Path
 
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from anki_gen.core.flashcard_generator import FlashcardGenerator, GeminiError
-from anki_gen.models.flashcard import AnkiExportConfig, GenerationResult
+from anki_gen.models.flashcard import (
+    AnkiExportConfig,
+    GenerationMetadata,
+    GenerationResult,
+)
 from anki_gen.models.output import BookOutput, ChapterOutput
 
+# Section number in chapter file names (chapter_011.json -> 011)
+_CHAPTER_NUM_RE = re.compile(r"chapter_(\d+)")
+
+# Metadata is written as UTF-8 bytes straight from the serializer
+_METADATA_ADAPTER = TypeAdapter(GenerationMetadata)
+
 
 def find_chapter_files(chapters_dir: Path) -> list[Path]:
     """Find all chapter JSON files in directory.
@@ -78,7 +89,7 @@ def filter_chapter_files(chapter_files: list[Path], selection: str | None) -> li
 
 def load_chapter(path: Path) -> ChapterOutput:
     """Load a chapter JSON file."""
-    return ChapterOutput.model_validate_json(path.read_text())
+    return ChapterOutput.model_validate_json(path.read_bytes())
 
 
 def load_manifest(chapters_dir: Path) -> BookOutput:
@@ -89,12 +100,12 @@ def load_manifest(chapters_dir: Path) -> BookOutput:
             f"manifest.json not found in {chapters_dir}. "
             "Make sure you've run 'anki-gen parse' first."
         )
-    return BookOutput.model_validate_json(manifest_path.read_text())
+    return BookOutput.model_validate_json(manifest_path.read_bytes())
 
 
 def extract_chapter_number(chapter_path: Path) -> int:
     """Extract chapter number from filename (chapter_011.json -> 11)."""
-    match = re.search(r"chapter_(\d+)", chapter_path.stem)
+    match = _CHAPTER_NUM_RE.search(chapter_path.stem)
     if match:
         return int(match.group(1))
     return 0
@@ -173,7 +184,7 @@ def save_generation_result(
 
     # Save metadata
     meta_path = chapter_dir / f"{base_name}_meta.json"
-    meta_path.write_text(result.metadata.model_dump_json(indent=2))
+    meta_path.write_bytes(_METADATA_ADAPTER.dump_json(result.metadata, indent=2))
 
     return cards_path, meta_path
 
@@ -189,8 +200,14 @@ def execute_generate(
     deck: str | None = None,
     tags: list[str] | None = None,
     force: bool = False,
+    use_sdk: bool = False,
+    jobs: int = 1,
 ) -> None:
-    """Execute the generate command."""
+    """Execute the generate command.
+
+    With jobs > 1, sections are generated concurrently and reported as each
+    one finishes; the live streaming panel is disabled in that mode.
+    """
     # Load manifest (required for book metadata)
     try:
         manifest = load_manifest(chapters_dir)
@@ -206,9 +223,11 @@ def execute_generate(
         console.print("[dim]Make sure you've run 'anki-gen parse' first.[/]")
         return
 
-    # Split into already-generated and pending
-    already_generated = [f for f in selected_files if is_chapter_generated(f)]
-    pending_files = [f for f in selected_files if not is_chapter_generated(f)]
+    # Split into already-generated and pending (one existence check per file)
+    already_generated: list[Path] = []
+    pending_files: list[Path] = []
+    for f in selected_files:
+        (already_generated if is_chapter_generated(f) else pending_files).append(f)
 
     # Determine which files to process
     if force:
@@ -224,6 +243,10 @@ def execute_generate(
             book_title_display += "..."
         console.print(f"[dim]Book:[/] {book_title_display}")
         console.print(f"[dim]Model: {model}[/]")
+        if use_sdk:
+            console.print("[dim]Backend: google-genai SDK[/]")
+        if jobs > 1:
+            console.print(f"[dim]Concurrent sections: {jobs}[/]")
         if deck:
             console.print(f"[dim]Deck override: {deck}[/]")
         if tags:
@@ -309,48 +332,86 @@ def execute_generate(
         model=model,
         max_cards=max_cards,
         console=console,
-        stream=not quiet,
+        stream=not quiet and jobs == 1,
         book_slug=book_slug,
+        use_sdk=use_sdk,
     )
 
     results: list[tuple[str, int, int]] = []  # (title, basic_count, cloze_count)
     errors: list[tuple[str, str]] = []  # (title, error_message)
 
-    for i, chapter_path in enumerate(chapter_files):
-        chapter = load_chapter(chapter_path)
-        title = chapter.metadata.title
-        short_title = title[:50] + "..." if len(title) > 50 else title
-        section_index = extract_chapter_number(chapter_path)
+    def record_failure(title: str, error: Exception) -> None:
+        """Record a section that failed to generate or save."""
+        if isinstance(error, GeminiError):
+            errors.append((title, str(error)))
+            if not quiet:
+                console.print(f"  [red]✗[/] Error: {error}")
+        else:
+            errors.append((title, f"Unexpected error: {error}"))
+            if not quiet:
+                console.print(f"  [red]✗[/] Unexpected error: {error}")
 
-        if not quiet:
-            console.print(f"\n[bold cyan][{section_index}/{len(all_chapter_files)}][/] {short_title}")
+    def record_result(
+        chapter_path: Path, chapter: ChapterOutput, result: GenerationResult | Exception
+    ) -> None:
+        """Save a generated section or record its error."""
+        title = chapter.metadata.title
+        if isinstance(result, Exception):
+            record_failure(title, result)
+            return
 
         try:
-            # Generate cards
-            result = generator.generate(chapter, chapter_path.name)
-
             # Build export config
             config = build_export_config(manifest, chapter_path, chapter, deck, tags)
 
             # Save combined file
             save_generation_result(result, chapter_path, config)
-            results.append((title, result.metadata.basic_count, result.metadata.cloze_count))
+        except Exception as e:
+            record_failure(title, e)
+            return
 
-            if not quiet:
-                console.print(
-                    f"  [green]✓[/] Generated [green]{result.metadata.basic_count}[/] basic, "
-                    f"[blue]{result.metadata.cloze_count}[/] cloze cards"
-                )
+        results.append((title, result.metadata.basic_count, result.metadata.cloze_count))
+        if not quiet:
+            console.print(
+                f"  [green]✓[/] Generated [green]{result.metadata.basic_count}[/] basic, "
+                f"[blue]{result.metadata.cloze_count}[/] cloze cards"
+            )
 
-        except GeminiError as e:
-            errors.append((title, str(e)))
-            if not quiet:
-                console.print(f"  [red]✗[/] Error: {e}")
+    def print_header(chapter_path: Path, chapter: ChapterOutput) -> None:
+        title = chapter.metadata.title
+        short_title = title[:50] + "..." if len(title) > 50 else title
+        section_index = extract_chapter_number(chapter_path)
+        console.print(
+            f"\n[bold cyan][{section_index}/{len(all_chapter_files)}][/] {short_title}"
+        )
 
-        except Exception as e:
-            errors.append((title, f"Unexpected error: {e}"))
+    if jobs > 1:
+        # Load up front, then report sections in completion order
+        loaded = {path.name: (path, load_chapter(path)) for path in chapter_files}
+        items = [(chapter, name) for name, (_, chapter) in loaded.items()]
+        for source_file, result, notes in generator.generate_many(items, jobs):
+            chapter_path, chapter = loaded[source_file]
             if not quiet:
-                console.print(f"  [red]✗[/] Unexpected error: {e}")
+                print_header(chapter_path, chapter)
+            # Warnings were collected on the worker thread; print them under
+            # this section's header
+            for note in notes:
+                console.print(note)
+            record_result(chapter_path, chapter, result)
+    else:
+        for chapter_path in chapter_files:
+            chapter = load_chapter(chapter_path)
+            if not quiet:
+                print_header(chapter_path, chapter)
+
+            try:
+                # Generate cards
+                result: GenerationResult | Exception = generator.generate(
+                    chapter, chapter_path.name
+                )
+            except Exception as e:
+                result = e
+            record_result(chapter_path, chapter, result)
 
     # Summary
     if not quiet:
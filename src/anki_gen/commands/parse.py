@@ -17,6 +17,12 @@ from anki_gen.core.parser_factory import ParserFactory
 from anki_gen.models.book import ParsedBook, TOCEntry
 from anki_gen.models.extraction import ExtractionMethod
 
+# Section range in a selection string ("10-15", "10 - 15")
+_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+# Characters dropped from, and runs collapsed in, default output dir names
+_STEM_UNSAFE_RE = re.compile(r"[^\w\s-]")
+_STEM_SPACING_RE = re.compile(r"[-\s]+")
+
 
 def parse_chapter_selection(selection: str, total_chapters: int) -> list[int]:
     """Parse user chapter selection string to list of indices.
@@ -36,7 +42,7 @@ def parse_chapter_selection(selection: str, total_chapters: int) -> list[int]:
             continue
 
         if "-" in part:
-            match = re.match(r"(\d+)\s*-\s*(\d+)", part)
+            match = _RANGE_RE.match(part)
             if match:
                 start, end = int(match.group(1)), int(match.group(2))
                 indices.update(range(start - 1, end))  # Convert to 0-based
@@ -104,8 +110,8 @@ def get_default_output_dir(book_path: Path) -> Path:
     """Get default output directory based on book filename."""
     stem = book_path.stem
     # Clean up the filename for directory name
-    clean_stem = re.sub(r"[^\w\s-]", "", stem).strip()
-    clean_stem = re.sub(r"[-\s]+", "_", clean_stem)
+    clean_stem = _STEM_UNSAFE_RE.sub("", stem).strip()
+    clean_stem = _STEM_SPACING_RE.sub("_", clean_stem)
     return book_path.parent / f"{clean_stem}_chapters"
 
 
@@ -1,5 +1,6 @@
 """Status command implementation."""
 
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,6 +12,9 @@ from rich.table import Table
 
 from anki_gen.models.output import BookOutput, ChapterOutput
 
+# Parsed section (chapter_011.json) or generated cards (chapter_011_cards.txt)
+_SECTION_FILE_RE = re.compile(r"chapter_(\d+)(?:\.json|(_cards\.txt))")
+
 
 @dataclass
 class SectionStatus:
@@ -39,19 +43,28 @@ class DirectoryStatus:
     export_card_count: int
 
 
+def _scan_section_files(chapters_dir: Path) -> tuple[dict[int, Path], dict[int, Path]]:
+    """Find parsed section JSON files and generated card files in one pass.
+
+    Returns: (parsed, generated) dicts mapping section number to file path
+    """
+    parsed: dict[int, Path] = {}
+    generated: dict[int, Path] = {}
+    with os.scandir(chapters_dir) as entries:
+        for entry in entries:
+            match = _SECTION_FILE_RE.fullmatch(entry.name)
+            if match:
+                target = generated if match.group(2) else parsed
+                target[int(match.group(1))] = Path(entry.path)
+    return parsed, generated
+
+
 def find_parsed_sections(chapters_dir: Path) -> dict[int, Path]:
     """Find all parsed section JSON files.
 
     Returns: dict mapping section number to file path
     """
-    result = {}
-    for path in chapters_dir.glob("chapter_*.json"):
-        if path.name == "manifest.json":
-            continue
-        match = re.search(r"chapter_(\d+)\.json$", path.name)
-        if match:
-            result[int(match.group(1))] = path
-    return result
+    return _scan_section_files(chapters_dir)[0]
 
 
 def find_generated_sections(chapters_dir: Path) -> dict[int, Path]:
@@ -59,12 +72,7 @@ def find_generated_sections(chapters_dir: Path) -> dict[int, Path]:
 
     Returns: dict mapping section number to file path
     """
-    result = {}
-    for path in chapters_dir.glob("chapter_*_cards.txt"):
-        match = re.search(r"chapter_(\d+)_cards\.txt$", path.name)
-        if match:
-            result[int(match.group(1))] = path
-    return result
+    return _scan_section_files(chapters_dir)[1]
 
 
 def count_cards_in_file(path: Path) -> tuple[int, int]:
@@ -105,12 +113,12 @@ def load_manifest(chapters_dir: Path) -> BookOutput | None:
     manifest_path = chapters_dir / "manifest.json"
     if not manifest_path.exists():
         return None
-    return BookOutput.model_validate_json(manifest_path.read_text())
+    return BookOutput.model_validate_json(manifest_path.read_bytes())
 
 
 def load_chapter(path: Path) -> ChapterOutput:
     """Load a chapter JSON file."""
-    return ChapterOutput.model_validate_json(path.read_text())
+    return ChapterOutput.model_validate_json(path.read_bytes())
 
 
 def get_directory_status(chapters_dir: Path) -> DirectoryStatus | None:
@@ -119,8 +127,7 @@ def get_directory_status(chapters_dir: Path) -> DirectoryStatus | None:
     if not manifest:
         return None
 
-    parsed_sections = find_parsed_sections(chapters_dir)
-    generated_sections = find_generated_sections(chapters_dir)
+    parsed_sections, generated_sections = _scan_section_files(chapters_dir)
 
     # Build section status list
     sections: list[SectionStatus] = []
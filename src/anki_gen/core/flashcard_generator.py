@@ -1,9 +1,15 @@
 """Flashcard generation using Gemini CLI."""
 
+import contextlib
+import hashlib
+import io
 import re
 import subprocess
+import threading
 import time
 from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -18,6 +24,7 @@ from anki_gen.models.output import ChapterOutput
 
 if TYPE_CHECKING:
     from rich.console import Console
+    from rich.panel import Panel
 
 
 class GeminiError(Exception):
@@ -155,13 +162,202 @@ Return ONLY the cards, no other text.
 ## Chapter Content:
 {chapter_content}"""
 
+# Static prompt text around the three placeholders, split once at import so
+# building a prompt is a single join rather than a template parse per chapter
+_PROMPT_CHUNKS = UNIFIED_CARD_PROMPT.format(
+    max_cards_instruction="\0", chapter_title="\0", chapter_content="\0"
+).split("\0")
+
+
+class _CardParser:
+    """Incrementally parse unified Gemini output into cards.
+
+    Lines are fed one at a time, so cards can be parsed while Gemini is still
+    streaming its response. With max_cards set, parsing stops once that many
+    valid cards have been collected.
+    """
+
+    def __init__(
+        self, chapter_id: str, book_slug: str = "", max_cards: int | None = None
+    ):
+        self.chapter_id = chapter_id
+        self.book_slug = book_slug
+        self.max_cards = max_cards
+        # GUID prefix (book_slug-chapter_id for uniqueness across books)
+        self.guid_prefix = f"{book_slug}-{chapter_id}" if book_slug else chapter_id
+        self.basic_cards: list[BasicCard] = []
+        self.cloze_cards: list[ClozeCard] = []
+        self.warnings: list[str] = []
+        self.card_sequence = 0
+        self.line_num = 0
+        self.full = False  # Set once max_cards valid cards have been parsed
+
+    def feed(self, line: str) -> bool:
+        """Parse a single output line into a card or a warning.
+
+        Returns True once the parser is full; later lines are ignored, so the
+        caller can stop reading output.
+        """
+        if self.full:
+            return True
+        self.line_num += 1
+        self._parse_line(line, self.line_num)
+        if self.max_cards and (
+            len(self.basic_cards) + len(self.cloze_cards) >= self.max_cards
+        ):
+            self.full = True
+        return self.full
+
+    def _parse_line(self, line: str, line_num: int) -> None:
+        line = line.strip()
+        if not line or "|" not in line:
+            return
+
+        # Split into parts; only the first four fields are used, so stop
+        # splitting after them
+        parts = line.split("|", 4)
+        if len(parts) < 3:
+            self.warnings.append(
+                f"Line {line_num}: Malformed card (fewer than 3 fields)"
+            )
+            return
+
+        card_type = parts[0].strip()
+        field1 = parts[1].strip()
+        field2 = parts[2].strip()
+
+        # Extract tags (4th field if present)
+        tags: list[str] = []
+        if len(parts) >= 4:
+            raw_tags = parts[3].strip()
+            if raw_tags:
+                tags = AnkiExportConfig.sanitize_tags(raw_tags)
+
+        # Generate GUID (prefix-sequence)
+        self.card_sequence += 1
+        guid = f"{self.guid_prefix}-{self.card_sequence:03d}"
+
+        if card_type == "Basic":
+            if not field1 or not field2:
+                self.warnings.append(f"Line {line_num}: Empty question or answer")
+                return
+            self.basic_cards.append(
+                BasicCard(
+                    front=field1,
+                    back=field2,
+                    tags=tags,
+                    guid=guid,
+                )
+            )
+        elif card_type == "Cloze":
+            if not field1:
+                self.warnings.append(f"Line {line_num}: Empty cloze text")
+                return
+            # Validate cloze markers
+            if "{{c" not in field1:
+                self.warnings.append(
+                    f"Line {line_num}: Cloze card missing {{{{c1::...}}}} markers"
+                )
+                return
+            self.cloze_cards.append(
+                ClozeCard(
+                    text=field1,
+                    back_extra=field2,
+                    tags=tags,
+                    guid=guid,
+                )
+            )
+        else:
+            self.warnings.append(f"Line {line_num}: Unknown card type '{card_type}'")
+
+
+class _StreamView:
+    """Assemble streamed Gemini output into lines and render it for rich Live.
+
+    Text is fed in arbitrary chunks; each complete non-empty line is recorded
+    and passed to on_line. If on_line returns True no more output is needed:
+    done is set and further text is ignored. Live redraws the view from its
+    own refresh thread, so the reader never waits on terminal output.
+    """
+
+    def __init__(
+        self, max_lines: int, on_line: Callable[[str], bool | None] | None = None
+    ):
+        # Most recent lines, already truncated for display
+        self.lines_buffer: deque[str] = deque(maxlen=max_lines)
+        self.output = io.StringIO()  # Full response, newline-separated
+        self.line_count = 0
+        self.char_count = 0  # Total characters fed, to bound runaway output
+        self.pending = ""  # Trailing partial line, completed by the next feed
+        self.on_line = on_line
+        self.done = False
+        # Last rendered panel and the line count it reflects
+        self._panel: Panel | None = None
+        self._panel_line_count = -1
+
+    def _add_line(self, line: str) -> None:
+        if self.line_count:
+            self.output.write("\n")
+        self.output.write(line)
+        self.line_count += 1
+        # Truncate long lines for display once, not on every redraw
+        self.lines_buffer.append(line[:100] + "..." if len(line) > 100 else line)
+        if self.on_line and self.on_line(line):
+            self.done = True
+
+    def feed(self, data: str) -> None:
+        """Split decoded output into complete lines."""
+        self.char_count += len(data)
+        *complete, self.pending = (self.pending + data).split("\n")
+        for line in complete:
+            if self.done:
+                return
+            line = line.replace("\r", "")
+            if line.strip():
+                self._add_line(line)
+
+    def finish(self) -> str:
+        """Flush any trailing partial line and return the full response."""
+        trailing = self.pending.replace("\r", "")
+        self.pending = ""
+        if trailing.strip() and not self.done:
+            self._add_line(trailing)
+        return self.output.getvalue()
+
+    def __rich__(self) -> "Panel":
+        from rich.panel import Panel
+        from rich.text import Text
+
+        # Live redraws more often than lines arrive; reuse the last panel
+        # until the line count changes
+        line_count = self.line_count
+        if self._panel is None or self._panel_line_count != line_count:
+            # Snapshot: this runs on Live's refresh thread while lines arrive
+            content = Text("\n".join(tuple(self.lines_buffer)), style="dim")
+            self._panel = Panel(
+                content,
+                title="[cyan]Generating flashcards[/]",
+                subtitle=f"[dim]{line_count} cards[/]",
+                border_style="blue",
+            )
+            self._panel_line_count = line_count
+        return self._panel
+
 
 class FlashcardGenerator:
     """Generate flashcards from chapter content using Gemini."""
 
     DEFAULT_MODEL = "gemini-3-pro-preview"
     TIMEOUT_SECONDS = 600  # 10 minutes
+    IDLE_TIMEOUT_SECONDS = 120  # Longest silence (e.g. model thinking) before giving up
     STREAM_LINES = 10  # Number of lines to show in streaming output
+    READ_SIZE = 16384  # Bytes per read from the Gemini CLI's pty
+    EXIT_CHECK_SECONDS = 1.0  # How often a silent stream checks if the CLI exited
+    MAX_RESPONSE_CHARS = 1_000_000  # Far above any real response; stops runaway loops
+    MAX_CONCURRENCY = 4  # Chapters generated at once by generate_many
+    _CHAPTER_RE = re.compile(r"chapter_(\d+)")
+    # Output lines that can hold a card (anything else is skipped)
+    _CARD_LINE_RE = re.compile(r"^[^\n|]*\|.*$", re.MULTILINE)
 
     def __init__(
         self,
@@ -170,12 +366,23 @@ class FlashcardGenerator:
         console: "Console | None" = None,
         stream: bool = True,
         book_slug: str = "",
+        use_sdk: bool = False,
     ):
         self.model = model
         self.max_cards = max_cards
         self.console = console
         self.stream = stream and console is not None
         self.book_slug = book_slug
+        self.use_sdk = use_sdk
+        self._sdk_client = None  # Created on first SDK call, then reused
+        # generate_many makes SDK calls from several threads at once
+        self._sdk_client_lock = threading.Lock()
+        # Fixed for the generator's lifetime, so build it once
+        self._max_cards_instruction = self._get_max_cards_instruction()
+        # Raw Gemini responses keyed by section title and normalized content,
+        # so repeated sections (summaries, recurring intro slides) reuse a
+        # response
+        self._response_cache: dict[str, str] = {}
 
     def _get_max_cards_instruction(self) -> str:
         """Get instruction for max cards."""
@@ -185,49 +392,56 @@ class FlashcardGenerator:
 
     def _build_prompt(self, chapter: ChapterOutput) -> str:
         """Build the unified prompt for card generation."""
-        return UNIFIED_CARD_PROMPT.format(
-            max_cards_instruction=self._get_max_cards_instruction(),
-            chapter_title=chapter.metadata.title,
-            chapter_content=chapter.content,
+        before_instruction, before_title, before_content, tail = _PROMPT_CHUNKS
+        return "".join(
+            (
+                before_instruction,
+                self._max_cards_instruction,
+                before_title,
+                chapter.metadata.title,
+                before_content,
+                chapter.content,
+                tail,
+            )
         )
 
-    def _call_gemini_streaming(self, prompt: str) -> str:
+    def _content_fingerprint(self, chapter: ChapterOutput) -> str:
+        """Hash the chapter title and content, as both appear in the prompt.
+
+        Content whitespace is normalized, so sections with the same title that
+        differ only in spacing or line breaks map to the same fingerprint.
+        Case is kept, since it can carry meaning (acronyms, names, code).
+        """
+        normalized = " ".join(chapter.content.split())
+        key = f"{chapter.metadata.title}\0{normalized}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _call_gemini_streaming(
+        self, prompt: str, on_line: Callable[[str], bool | None] | None = None
+    ) -> str:
         """Call Gemini CLI with streaming output display.
 
         Uses a pseudo-terminal (pty) to get unbuffered output from Gemini CLI.
+        Each non-empty line is passed to on_line as soon as it is complete; if
+        on_line returns True, Gemini is stopped early.
         Returns the full response text.
         """
+        import codecs
         import os
         import pty
-        import select
+        import selectors
 
         from rich.live import Live
-        from rich.panel import Panel
-        from rich.text import Text
 
         cmd = ["gemini", "-m", self.model, prompt]
-
-        lines_buffer: deque[str] = deque(maxlen=self.STREAM_LINES)
-        all_output: list[str] = []
-        current_line = ""
-
-        def render_panel() -> Panel:
-            content = Text()
-            for i, line in enumerate(lines_buffer):
-                if i > 0:
-                    content.append("\n")
-                # Truncate long lines for display
-                display_line = line[:100] + "..." if len(line) > 100 else line
-                content.append(display_line, style="dim")
-            return Panel(
-                content,
-                title="[cyan]Generating flashcards[/]",
-                subtitle=f"[dim]{len(all_output)} cards[/]",
-                border_style="blue",
-            )
+        view = _StreamView(self.STREAM_LINES, on_line)
+        # Reads can end mid-character; the incremental decoder holds partial
+        # UTF-8 sequences until the rest arrives instead of replacing them
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
         # Create a pseudo-terminal to get unbuffered output
         master_fd, slave_fd = pty.openpty()
+        selector = selectors.DefaultSelector()
 
         try:
             process = subprocess.Popen(
@@ -239,89 +453,87 @@ class FlashcardGenerator:
             )
             os.close(slave_fd)  # Close slave in parent process
 
-            with Live(
-                render_panel(), console=self.console, refresh_per_second=4
-            ) as live:
-                start_time = time.time()
+            # Block in select() until output arrives, a deadline passes or it
+            # is time to check whether the CLI has exited
+            os.set_blocking(master_fd, False)
+            selector.register(master_fd, selectors.EVENT_READ)
+
+            with Live(view, console=self.console, refresh_per_second=4):
+                deadline = time.monotonic() + self.TIMEOUT_SECONDS
+                idle_deadline = time.monotonic() + self.IDLE_TIMEOUT_SECONDS
 
                 while True:
-                    # Check timeout
-                    if time.time() - start_time > self.TIMEOUT_SECONDS:
+                    # Check timeouts (overall, and since the last output)
+                    now = time.monotonic()
+                    if now >= deadline:
                         process.kill()
+                        process.wait()
                         raise GeminiError(
                             "TIMEOUT",
                             f"Request timed out after {self.TIMEOUT_SECONDS}s",
                         )
+                    if now >= idle_deadline:
+                        process.kill()
+                        process.wait()
+                        raise GeminiError(
+                            "IDLE_TIMEOUT",
+                            f"No output for {self.IDLE_TIMEOUT_SECONDS}s",
+                        )
 
-                    # Check if there's data to read
-                    ready, _, _ = select.select([master_fd], [], [], 0.1)
-
-                    if ready:
-                        try:
-                            data = os.read(master_fd, 1024).decode(
-                                "utf-8", errors="replace"
-                            )
-                            if not data:
-                                break
-
-                            # Process the data character by character for line detection
-                            for char in data:
-                                if char == "\n":
-                                    if current_line.strip():
-                                        lines_buffer.append(current_line)
-                                        all_output.append(current_line)
-                                        live.update(render_panel())
-                                    current_line = ""
-                                elif char != "\r":
-                                    current_line += char
-
-                        except OSError:
+                    timeout = min(deadline, idle_deadline) - now
+                    if not selector.select(min(timeout, self.EXIT_CHECK_SECONDS)):
+                        # A background child of the CLI can keep the pty open
+                        # after the CLI exits, so EOF may never arrive
+                        if process.poll() is not None:
+                            # Drain output written just before exit
+                            with contextlib.suppress(OSError):
+                                while data := os.read(master_fd, self.READ_SIZE):
+                                    view.feed(decoder.decode(data))
                             break
+                        continue
+
+                    try:
+                        data = os.read(master_fd, self.READ_SIZE)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        # EIO: the process exited and closed its end of the pty
+                        break
+                    if not data:
+                        break
 
-                    # Check if process has finished
-                    if process.poll() is not None:
-                        # Read any remaining data
-                        try:
-                            while True:
-                                ready, _, _ = select.select([master_fd], [], [], 0.1)
-                                if not ready:
-                                    break
-                                data = os.read(master_fd, 1024).decode(
-                                    "utf-8", errors="replace"
-                                )
-                                if not data:
-                                    break
-                                for char in data:
-                                    if char == "\n":
-                                        if current_line.strip():
-                                            lines_buffer.append(current_line)
-                                            all_output.append(current_line)
-                                        current_line = ""
-                                    elif char != "\r":
-                                        current_line += char
-                        except OSError:
-                            pass
+                    idle_deadline = time.monotonic() + self.IDLE_TIMEOUT_SECONDS
+                    view.feed(decoder.decode(data))
+                    if view.done:
+                        # Enough cards; stop paying for output we'd discard
+                        process.kill()
                         break
+                    if view.char_count > self.MAX_RESPONSE_CHARS:
+                        process.kill()
+                        process.wait()
+                        raise GeminiError(
+                            "OUTPUT_LIMIT",
+                            f"Response exceeded {self.MAX_RESPONSE_CHARS:,} characters",
+                        )
 
                 # Don't forget any trailing content
-                if current_line.strip():
-                    lines_buffer.append(current_line)
-                    all_output.append(current_line)
-                    live.update(render_panel())
+                view.feed(decoder.decode(b"", final=True))
+                response = view.finish()
 
             # Wait for process to fully terminate and get return code
             process.wait()
 
         finally:
+            selector.close()
             os.close(master_fd)
 
         # Only raise error for actual non-zero exit codes
-        if process.returncode and process.returncode != 0:
+        if process.returncode and process.returncode != 0 and not view.done:
             raise GeminiError(
                 "CLI_ERROR", f"Gemini exited with code {process.returncode}"
             )
 
-        return "\n".join(all_output)
+        return response
 
     def _call_gemini_batch(self, prompt: str) -> str:
         """Call Gemini CLI without streaming (quiet mode).
@@ -348,10 +560,90 @@ class FlashcardGenerator:
 
         return result.stdout
 
-    def _call_gemini(self, prompt: str) -> str:
-        """Call Gemini CLI and return response text."""
+    def _call_gemini_sdk(
+        self, prompt: str, on_line: Callable[[str], bool | None] | None = None
+    ) -> str:
+        """Call Gemini through the google-genai SDK.
+
+        Talks to the API from this process, skipping the CLI's process and
+        Node.js startup on every call. Requires the sdk extra and an API key
+        in GEMINI_API_KEY or GOOGLE_API_KEY. The response is always streamed
+        to on_line; the live panel is only shown in streaming mode.
+        Returns the full response text.
+        """
+        try:
+            import httpx
+            from google import genai
+            from google.genai import errors, types
+        except ImportError:
+            raise GeminiError(
+                "SDK_ERROR",
+                "google-genai is not installed (pip install 'anki-gen[sdk]')",
+            )
+        from rich.live import Live
+
+        with self._sdk_client_lock:
+            if self._sdk_client is None:
+                try:
+                    # httpx applies the timeout to each read, so it bounds the
+                    # silence between streamed chunks
+                    self._sdk_client = genai.Client(
+                        http_options=types.HttpOptions(
+                            timeout=self.IDLE_TIMEOUT_SECONDS * 1000
+                        )
+                    )
+                except ValueError as e:
+                    # Raised when no API key is configured
+                    raise GeminiError("SDK_ERROR", str(e))
+
+        view = _StreamView(self.STREAM_LINES, on_line)
+        display = (
+            Live(view, console=self.console, refresh_per_second=4)
+            if self.stream
+            else contextlib.nullcontext()
+        )
+        deadline = time.monotonic() + self.TIMEOUT_SECONDS
+
+        try:
+            with display:
+                chunks = self._sdk_client.models.generate_content_stream(
+                    model=self.model, contents=prompt
+                )
+                for chunk in chunks:
+                    if chunk.text:
+                        view.feed(chunk.text)
+                    if view.done:
+                        break
+                    if view.char_count > self.MAX_RESPONSE_CHARS:
+                        raise GeminiError(
+                            "OUTPUT_LIMIT",
+                            f"Response exceeded {self.MAX_RESPONSE_CHARS:,} characters",
+                        )
+                    if time.monotonic() > deadline:
+                        raise GeminiError(
+                            "TIMEOUT",
+                            f"Request timed out after {self.TIMEOUT_SECONDS}s",
+                        )
+                return view.finish()
+        except httpx.TimeoutException:
+            raise GeminiError(
+                "IDLE_TIMEOUT", f"No output for {self.IDLE_TIMEOUT_SECONDS}s"
+            )
+        except errors.APIError as e:
+            raise GeminiError("API_ERROR", e.message or str(e), code=e.code)
+
+    def _call_gemini(
+        self, prompt: str, on_line: Callable[[str], bool | None] | None = None
+    ) -> str:
+        """Call Gemini and return response text.
+
+        In streaming mode, on_line is called with each output line as it arrives
+        and may return True to stop the response early.
+        """
+        if self.use_sdk:
+            return self._call_gemini_sdk(prompt, on_line)
         if self.stream:
-            return self._call_gemini_streaming(prompt)
+            return self._call_gemini_streaming(prompt, on_line)
         return self._call_gemini_batch(prompt)
 
     def _extract_chapter_id(self, source_file: str) -> str:
@@ -361,7 +653,7 @@ class FlashcardGenerator:
             chapter_011.json -> ch011
             chapter_001.json -> ch001
         """
-        match = re.search(r"chapter_(\d+)", source_file)
+        match = self._CHAPTER_RE.search(source_file)
         if match:
             return f"ch{match.group(1)}"
         return "ch000"
@@ -373,109 +665,79 @@ class FlashcardGenerator:
 
         Returns: (basic_cards, cloze_cards, warnings)
         """
-        basic_cards: list[BasicCard] = []
-        cloze_cards: list[ClozeCard] = []
-        warnings: list[str] = []
-        card_sequence = 0
-
-        lines = response_text.strip().split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or "|" not in line:
-                continue
-
-            # Split into parts
-            parts = line.split("|")
-            if len(parts) < 3:
-                warnings.append(
-                    f"Line {line_num}: Malformed card (fewer than 3 fields)"
-                )
-                continue
-
-            card_type = parts[0].strip()
-            field1 = parts[1].strip()
-            field2 = parts[2].strip()
-
-            # Extract tags (4th field if present)
-            tags: list[str] = []
-            if len(parts) >= 4:
-                raw_tags = parts[3].strip()
-                if raw_tags:
-                    # Split on spaces, filter empty
-                    tags = [
-                        AnkiExportConfig.sanitize_tag(t)
-                        for t in raw_tags.split()
-                        if t.strip()
-                    ]
-
-            # Generate GUID (book_slug-chapter_id-sequence for uniqueness across books)
-            card_sequence += 1
-            if self.book_slug:
-                guid = f"{self.book_slug}-{chapter_id}-{card_sequence:03d}"
-            else:
-                guid = f"{chapter_id}-{card_sequence:03d}"
-
-            if card_type == "Basic":
-                if not field1 or not field2:
-                    warnings.append(f"Line {line_num}: Empty question or answer")
-                    continue
-                basic_cards.append(
-                    BasicCard(
-                        front=field1,
-                        back=field2,
-                        tags=tags,
-                        guid=guid,
-                    )
-                )
-            elif card_type == "Cloze":
-                if not field1:
-                    warnings.append(f"Line {line_num}: Empty cloze text")
-                    continue
-                # Validate cloze markers
-                if "{{c" not in field1:
-                    warnings.append(
-                        f"Line {line_num}: Cloze card missing {{{{c1::...}}}} markers"
-                    )
-                    continue
-                cloze_cards.append(
-                    ClozeCard(
-                        text=field1,
-                        back_extra=field2,
-                        tags=tags,
-                        guid=guid,
-                    )
-                )
-            else:
-                warnings.append(f"Line {line_num}: Unknown card type '{card_type}'")
-
-        return basic_cards, cloze_cards, warnings
-
-    def generate(self, chapter: ChapterOutput, source_file: str) -> GenerationResult:
-        """Generate flashcards for a chapter using unified prompt."""
+        parser = _CardParser(chapter_id, self.book_slug, self.max_cards)
+        text = response_text.strip()
+        # Jump straight to pipe-delimited lines, skipping any prose around
+        # them; line numbers are counted lazily so warnings still match
+        line_num = 0
+        pos = 0
+        # Bound once rather than looked up on every card line
+        feed = parser.feed
+        count_newlines = text.count
+        for match in self._CARD_LINE_RE.finditer(text):
+            start = match.start()
+            line_num += count_newlines("\n", pos, start)
+            pos = start
+            parser.line_num = line_num
+            if feed(match.group()):
+                break
+        return parser.basic_cards, parser.cloze_cards, parser.warnings
+
+    def generate(
+        self,
+        chapter: ChapterOutput,
+        source_file: str,
+        notes: list[str] | None = None,
+    ) -> GenerationResult:
+        """Generate flashcards for a chapter using unified prompt.
+
+        Warnings and progress notes are printed to the console, or appended to
+        notes when a list is given so a concurrent caller can print them with
+        the chapter's header.
+        """
         start_time = time.time()
-
-        # Build and send prompt
-        prompt = self._build_prompt(chapter)
-        response_text = self._call_gemini(prompt)
+        if notes is not None:
+            report = notes.append
+        elif self.console:
+            report = self.console.print
+        else:
+            report = None
 
         # Extract chapter ID for GUIDs
         chapter_id = self._extract_chapter_id(source_file)
-
-        # Parse unified output
-        basic_cards, cloze_cards, warnings = self._parse_unified_output(
-            response_text, chapter_id
-        )
+        parser = _CardParser(chapter_id, self.book_slug, self.max_cards)
+
+        # Reuse the response of an already generated section with the same
+        # title and content; cards are re-parsed below so GUIDs stay unique
+        # per chapter
+        fingerprint = self._content_fingerprint(chapter)
+        response_text = self._response_cache.get(fingerprint)
+        if response_text is None:
+            prompt = self._build_prompt(chapter)
+            response_text = self._call_gemini(prompt, on_line=parser.feed)
+            self._response_cache[fingerprint] = response_text
+        elif report:
+            report("  [dim]Reusing response from a section with identical content[/]")
+
+        # Streaming output was already parsed line by line as it arrived
+        if parser.line_num:
+            basic_cards = parser.basic_cards
+            cloze_cards = parser.cloze_cards
+            warnings = parser.warnings
+        else:
+            basic_cards, cloze_cards, warnings = self._parse_unified_output(
+                response_text, chapter_id
+            )
 
         # Log warnings if console available
-        if warnings and self.console:
+        if warnings and report:
             for warning in warnings:
-                self.console.print(f"  [yellow]Warning:[/] {warning}")
+                report(f"  [yellow]Warning:[/] {warning}")
 
         # Warn if no cards generated
         if not basic_cards and not cloze_cards:
-            if self.console:
-                self.console.print("  [yellow]Warning:[/] No valid cards generated")
+            if report:
+                report("  [yellow]Warning:[/] No valid cards generated")
 
         generation_time = time.time() - start_time
 
@@ -496,3 +758,39 @@ class FlashcardGenerator:
             basic_cards=basic_cards,
             cloze_cards=cloze_cards,
         )
+
+    def generate_many(
+        self,
+        items: list[tuple[ChapterOutput, str]],
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> Iterator[tuple[str, GenerationResult | Exception, list[str]]]:
+        """Generate several chapters concurrently.
+
+        Items are (chapter, source_file) pairs. Gemini calls are I/O bound, so
+        up to max_concurrency run at once in worker threads. Each
+        (source_file, result, notes) triple is yielded as soon as it
+        completes; a failed chapter yields its exception in place of the
+        result. Notes are the chapter's console messages, collected instead of
+        printed so they are not interleaved with other chapters' output.
+        """
+        if self.stream and max_concurrency > 1:
+            raise ValueError("Streaming output supports only one chapter at a time")
+
+        pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = {}
+            for chapter, source_file in items:
+                notes: list[str] = []
+                future = pool.submit(self.generate, chapter, source_file, notes)
+                futures[future] = (source_file, notes)
+            for future in as_completed(futures):
+                try:
+                    result: GenerationResult | Exception = future.result()
+                except Exception as e:
+                    result = e
+                source_file, notes = futures[future]
+                yield source_file, result, notes
+        finally:
+            # On Ctrl-C or when the caller stops early, drop chapters that have
+            # not started instead of waiting for their Gemini calls
+            pool.shutdown(wait=False, cancel_futures=True)
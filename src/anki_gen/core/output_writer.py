@@ -4,10 +4,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from pydantic import TypeAdapter
+
 from anki_gen.core.content_processor import ContentProcessor
 from anki_gen.models.book import Chapter, ParsedBook
 from anki_gen.models.output import BookOutput, ChapterMetadata, ChapterOutput
 
+# Serialize straight to UTF-8 bytes, skipping the str round trip of
+# model_dump_json() + write_text()
+_CHAPTER_ADAPTER = TypeAdapter(ChapterOutput)
+_MANIFEST_ADAPTER = TypeAdapter(BookOutput)
+
 
 class OutputWriter:
     """Write parsed chapters to output directory."""
@@ -23,6 +30,8 @@ class OutputWriter:
         self.source_path = source_path
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.processor = ContentProcessor()
+        # One timestamp for every chapter written in this extraction run
+        self.extracted_at = datetime.now()
 
     def write_chapter(
         self,
@@ -41,7 +50,7 @@ class OutputWriter:
             title=chapter.title,
             source_file=chapter.file_name,
             source_path=str(self.source_path),
-            extracted_at=datetime.now(),
+            extracted_at=self.extracted_at,
             word_count=stats["word_count"],
             character_count=stats["character_count"],
             paragraph_count=stats["paragraph_count"],
@@ -62,7 +71,7 @@ class OutputWriter:
         # Write file
         filename = f"chapter_{chapter.index + 1:03d}.json"
         filepath = self.output_dir / filename
-        filepath.write_text(output.model_dump_json(indent=2))
+        filepath.write_bytes(_CHAPTER_ADAPTER.dump_json(output, indent=2))
 
         return filepath, metadata
 
@@ -89,5 +98,5 @@ class OutputWriter:
         )
 
         filepath = self.output_dir / "manifest.json"
-        filepath.write_text(manifest.model_dump_json(indent=2))
+        filepath.write_bytes(_MANIFEST_ADAPTER.dump_json(manifest, indent=2))
         return filepath
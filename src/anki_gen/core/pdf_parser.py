@@ -3,9 +3,13 @@
 import logging
 import re
 from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable
 
 # Suppress warnings about malformed PDF object references from PDF libraries
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -21,6 +25,9 @@ from anki_gen.models.extraction import DetectionResult, ExtractionMethod, Sectio
 
 log = logging.getLogger(__name__)
 
+# Sort key for pdfplumber chars; itemgetter builds the key tuple in C
+_CHAR_ORDER = itemgetter("top", "x0")
+
 
 # =============================================================================
 # Cascade Layer Configuration
@@ -39,6 +46,60 @@ class CascadeLayer:
     description: str
 
 
+# =============================================================================
+# Shared PDF Handles
+# =============================================================================
+
+
+# Cache key for a file's current contents: (resolved path, mtime_ns, size).
+# A file rewritten in place gets a new key, so cached readers and page text
+# never go stale; the small cache sizes bound how many PDFs stay in memory.
+_FileKey = tuple[Path, int, int]
+
+
+def _file_key(pdf_path: Path) -> _FileKey:
+    """Identify a file's current contents for the reader and page-text caches."""
+    stat = pdf_path.stat()
+    return pdf_path.resolve(), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=2)
+def _open_reader_for(key: _FileKey) -> pypdf.PdfReader:
+    return pypdf.PdfReader(str(key[0]))
+
+
+def _open_reader(pdf_path: Path) -> pypdf.PdfReader:
+    """Open a pypdf reader once per file for the outline, page text and parser."""
+    return _open_reader_for(_file_key(pdf_path))
+
+
+# pdfplumber documents kept open by detect_sections, so layers and validation
+# reuse already-parsed pages
+_shared_plumber: dict[Path, pdfplumber.PDF] = {}
+
+
+@contextmanager
+def _open_plumber(pdf_path: Path) -> Iterator[pdfplumber.PDF]:
+    """Yield the shared pdfplumber document for this file, or open a new one."""
+    pdf = _shared_plumber.get(pdf_path)
+    if pdf is not None:
+        yield pdf
+        return
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        yield pdf
+
+
+@contextmanager
+def _share_plumber(pdf_path: Path) -> Iterator[None]:
+    """Keep one pdfplumber document open for the duration of the block."""
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        _shared_plumber[pdf_path] = pdf
+        try:
+            yield
+        finally:
+            del _shared_plumber[pdf_path]
+
+
 # =============================================================================
 # Layer 1: PDF Outline/Bookmarks
 # =============================================================================
@@ -51,36 +112,37 @@ def detect_by_outline(pdf_path: Path) -> DetectionResult | None:
 
     Returns None if no outline exists or outline has <2 entries.
     """
-    reader = pypdf.PdfReader(str(pdf_path))
+    reader = _open_reader(pdf_path)
 
     if not reader.outline:
         return None
 
     sections: list[Section] = []
 
-    def flatten_outline(items: list, level: int = 0) -> None:
-        """Recursively flatten nested outline."""
-        for item in items:
-            if isinstance(item, list):
-                # Nested items
-                flatten_outline(item, level + 1)
-            else:
-                # Destination object
-                try:
-                    page_num = reader.get_destination_page_number(item)
-                    sections.append(
-                        Section(
-                            title=item.title,
-                            page_start=page_num,
-                            level=level,
-                            confidence=0.95,
-                        )
-                    )
-                except Exception:
-                    # Skip malformed destinations
-                    continue
+    # Flatten the nested outline depth-first with an explicit stack; children
+    # are pushed in reverse so entries come off in document order
+    stack = [(item, 0) for item in reversed(reader.outline)]
+    while stack:
+        item, level = stack.pop()
+        if isinstance(item, list):
+            # Nested items
+            stack.extend((child, level + 1) for child in reversed(item))
+            continue
 
-    flatten_outline(reader.outline)
+        # Destination object
+        try:
+            page_num = reader.get_destination_page_number(item)
+            sections.append(
+                Section(
+                    title=item.title,
+                    page_start=page_num,
+                    level=level,
+                    confidence=0.95,
+                )
+            )
+        except Exception:
+            # Skip malformed destinations
+            continue
 
     if len(sections) >= 2:
         return DetectionResult(
@@ -102,36 +164,48 @@ def detect_by_font(pdf_path: Path) -> DetectionResult | None:
     Detect headings via font size relative to body text.
     Larger/bolder text = likely heading.
     """
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        # First pass: determine body text size (mode of font sizes)
-        all_sizes: list[float] = []
+    with _open_plumber(pdf_path) as pdf:
+        # Single pass over the pages: extract lines from each page, counting
+        # font sizes on the first pages to determine body text size
+        raw_sizes: Counter[float | None] = Counter()
         sample_pages = min(20, len(pdf.pages))
+        page_lines: list[list[dict]] = []
 
-        for page in pdf.pages[:sample_pages]:
-            if page.chars:
-                for char in page.chars:
-                    if char.get("size"):
-                        all_sizes.append(round(char["size"], 1))
-
-        if not all_sizes:
+        for page_num, page in enumerate(pdf.pages):
+            if page_num < sample_pages:
+                # map/dict.get keeps the per-char counting loop in C
+                raw_sizes.update(map(dict.get, page.chars, repeat("size")))
+            elif not any(raw_sizes):
+                # No sized text in the sample; don't parse the remaining pages
+                return None
+            page_lines.append(_extract_lines_from_page(page))
+
+        # Round once per distinct size rather than once per char
+        size_counts: Counter[float] = Counter()
+        for size, count in raw_sizes.items():
+            if size:
+                size_counts[round(size, 1)] += count
+
+        if not size_counts:
             return None
 
         # Body size = most common font size
-        size_counts = Counter(all_sizes)
         body_size = size_counts.most_common(1)[0][0]
 
-        # Second pass: find headings
+        # Find headings in the extracted lines
         sections: list[Section] = []
-        for page_num, page in enumerate(pdf.pages):
-            lines = _extract_lines_from_page(page)
-
+        for page_num, lines in enumerate(page_lines):
             for line in lines:
+                # Below 1.15x body size a line scores at most 0.4 (bold, caps,
+                # short), under the 0.5 threshold, so skip body text early
+                if not body_size or line["size"] / body_size < 1.15:
+                    continue
                 confidence = _calculate_heading_confidence(line, body_size)
 
                 if confidence >= 0.5:
                     sections.append(
                         Section(
-                            title=line["text"].strip(),
+                            title=line["stripped"],
                             page_start=page_num,
                             level=_infer_level_from_size(line["size"], body_size),
                             confidence=min(confidence, 0.85),
@@ -160,12 +234,16 @@ def _extract_lines_from_page(page) -> list[dict]:
         return lines
 
     current_line = {"text": "", "size": 0, "fontname": "", "top": 0, "x0": 0}
-    chars = sorted(page.chars, key=lambda c: (c["top"], c["x0"]))
+    # Reading order: top to bottom, then left to right
+    chars = sorted(page.chars, key=_CHAR_ORDER)
 
     for char in chars:
         # New line detection (vertical gap)
         if current_line["text"] and (char["top"] - current_line["top"]) > 5:
-            if current_line["text"].strip():
+            # Strip once here; scoring and section titles reuse it
+            stripped = current_line["text"].strip()
+            if stripped:
+                current_line["stripped"] = stripped
                 lines.append(current_line)
             current_line = {
                 "text": char.get("text", ""),
@@ -181,7 +259,9 @@ def _extract_lines_from_page(page) -> list[dict]:
                 current_line["size"] = char["size"]
                 current_line["fontname"] = char.get("fontname", "")
 
-    if current_line["text"].strip():
+    stripped = current_line["text"].strip()
+    if stripped:
+        current_line["stripped"] = stripped
         lines.append(current_line)
 
     return lines
@@ -201,12 +281,11 @@ def _calculate_heading_confidence(line: dict, body_size: float) -> float:
         confidence += 0.1
 
     # Bold detection
-    fontname = line.get("fontname", "").lower()
-    if "bold" in fontname or "heavy" in fontname:
+    if _is_bold_font(line.get("fontname", "")):
         confidence += 0.2
 
     # All caps
-    text = line["text"].strip()
+    text = line["stripped"]
     if text.isupper() and len(text) > 3:
         confidence += 0.1
 
@@ -215,14 +294,25 @@ def _calculate_heading_confidence(line: dict, body_size: float) -> float:
         confidence += 0.1
 
     # Exclude likely headers/footers
-    if _is_likely_header_footer(line, text):
+    if _is_likely_header_footer(text):
         confidence -= 0.5
 
     return max(0.0, confidence)
 
 
-def _is_likely_header_footer(line: dict, text: str) -> bool:
-    """Detect running headers/footers and non-content text to exclude."""
+@cache
+def _is_bold_font(fontname: str) -> bool:
+    """Check a font name for bold weight (PDFs use only a handful of fonts)."""
+    fontname = fontname.lower()
+    return "bold" in fontname or "heavy" in fontname
+
+
+@lru_cache(maxsize=4096)
+def _is_likely_header_footer(text: str) -> bool:
+    """Detect running headers/footers and non-content text to exclude.
+
+    Cached on the text, since running headers repeat on every page.
+    """
     text = text.strip()
     text_lower = text.lower()
     
@@ -289,53 +379,50 @@ SECTION_PATTERNS: list[tuple[str, float, str]] = [
     (r"^Lesson\s+(\d+)[:\s]", 0.55, "lesson"),
 ]
 
+# All patterns fused into one alternation, tried in the same order; group
+# p{i} wraps SECTION_PATTERNS[i], so a match's lastgroup names the pattern
+_SECTION_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern})"
+        for i, (pattern, _, _) in enumerate(SECTION_PATTERNS)
+    )
+)
+
 
 def detect_by_pattern(pdf_path: Path) -> DetectionResult | None:
     """
     Match common section/chapter patterns in text.
     Works well for consistently formatted textbooks.
     """
-    # Extract text with page boundaries for line-to-page mapping
-    reader = pypdf.PdfReader(str(pdf_path))
-    line_to_page: dict[int, int] = {}
-    all_lines: list[str] = []
-    current_line = 0
-
-    for page_num, page in enumerate(reader.pages):
-        page_text = page.extract_text() or ""
-        page_lines = page_text.split("\n")
-        for _ in page_lines:
-            line_to_page[current_line] = page_num
-            current_line += 1
-        all_lines.extend(page_lines)
-
     sections: list[Section] = []
     seen_patterns: dict[str, list] = {}  # Track pattern sequences
 
-    for line_num, line in enumerate(all_lines):
+    for line_num, page_num, line in _iter_lines_with_page(pdf_path):
         line_stripped = line.strip()
         if not line_stripped or len(line_stripped) > 100:
             continue
 
-        for pattern, base_confidence, pattern_type in SECTION_PATTERNS:
-            match = re.match(pattern, line_stripped)
-            if match:
-                # Track for sequence detection
-                if pattern_type not in seen_patterns:
-                    seen_patterns[pattern_type] = []
-                seen_patterns[pattern_type].append(match.group(1))
-
-                sections.append(
-                    Section(
-                        title=line_stripped,
-                        page_start=line_to_page.get(line_num, 0),
-                        line_number=line_num,
-                        level=1 if "part" in pattern_type else 2,
-                        confidence=base_confidence,
-                        pattern_type=pattern_type,
-                    )
+        # One match tries every pattern; the first that matches wins
+        match = _SECTION_RE.match(line_stripped)
+        if match:
+            _, base_confidence, pattern_type = SECTION_PATTERNS[
+                int(match.lastgroup[1:])
+            ]
+            # Track for sequence detection (pattern's own group follows p{i})
+            if pattern_type not in seen_patterns:
+                seen_patterns[pattern_type] = []
+            seen_patterns[pattern_type].append(match.group(match.lastindex + 1))
+
+            sections.append(
+                Section(
+                    title=line_stripped,
+                    page_start=page_num,
+                    line_number=line_num,
+                    level=1 if "part" in pattern_type else 2,
+                    confidence=base_confidence,
+                    pattern_type=pattern_type,
                 )
-                break  # Only match first pattern per line
+            )
 
     # Boost confidence for sequential patterns (1, 2, 3... or I, II, III...)
     sections = _boost_sequential_confidence(sections, seen_patterns)
@@ -351,6 +438,15 @@ def detect_by_pattern(pdf_path: Path) -> DetectionResult | None:
     return None
 
 
+def _iter_lines_with_page(pdf_path: Path) -> Iterator[tuple[int, int, str]]:
+    """Yield (line_number, page_number, line) for every line of the PDF text."""
+    line_num = 0
+    for page_num, page_text in enumerate(_extract_pages_text(pdf_path)):
+        for line in page_text.split("\n"):
+            yield line_num, page_num, line
+            line_num += 1
+
+
 def _boost_sequential_confidence(
     sections: list[Section], seen_patterns: dict[str, list]
 ) -> list[Section]:
@@ -393,13 +489,16 @@ def _check_sequence(values: list[str], pattern_type: str) -> bool:
     return False
 
 
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100}
+
+
+@lru_cache(maxsize=256)
 def _roman_to_int(s: str) -> int:
     """Convert Roman numeral to integer."""
-    values = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100}
     result = 0
     prev = 0
     for char in reversed(s.upper()):
-        curr = values.get(char, 0)
+        curr = _ROMAN_VALUES.get(char, 0)
         if curr < prev:
             result -= curr
         else:
@@ -408,13 +507,21 @@ def _roman_to_int(s: str) -> int:
     return result
 
 
+@lru_cache(maxsize=2)
+def _extract_pages_text_for(key: _FileKey) -> tuple[str, ...]:
+    reader = _open_reader_for(key)
+    return tuple(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_pages_text(pdf_path: Path) -> tuple[str, ...]:
+    """Extract the text of every page, cached so layers and chapter
+    extraction share one pypdf pass."""
+    return _extract_pages_text_for(_file_key(pdf_path))
+
+
 def _extract_full_text(pdf_path: Path) -> str:
     """Extract all text from PDF for pattern matching."""
-    reader = pypdf.PdfReader(str(pdf_path))
-    text_parts = []
-    for page in reader.pages:
-        text_parts.append(page.extract_text() or "")
-    return "\n".join(text_parts)
+    return "\n".join(_extract_pages_text(pdf_path))
 
 
 # =============================================================================
@@ -430,31 +537,43 @@ def detect_by_layout(pdf_path: Path) -> DetectionResult | None:
     - Short line length
     - Followed by body text
     """
-    with pdfplumber.open(str(pdf_path)) as pdf:
+    with _open_plumber(pdf_path) as pdf:
         sections: list[Section] = []
+        best_confidence: dict[str, float] = {}  # Highest score per title so far
 
         for page_num, page in enumerate(pdf.pages):
             lines = _extract_lines_with_positions(page)
-            page_height = page.height
+            # Page geometry thresholds, computed once per page
+            left_margin = page.width * 0.15
+            top_cut = page.height * 0.2
+            bottom_cut = page.height * 0.9
+            last = len(lines) - 1
 
             for i, line in enumerate(lines):
-                confidence = 0.0
                 text = line["text"].strip()
 
                 # Skip empty/short lines
                 if not text or len(text) < 3:
                     continue
 
+                # Exclude likely page numbers, headers, footers (these would
+                # score 0, so skip them before scoring)
+                top = line["top"]
+                if top > bottom_cut or _is_page_number(text):
+                    continue
+
+                confidence = 0.0
+
                 # Vertical whitespace before (gap from previous line)
                 if i > 0:
-                    gap = line["top"] - lines[i - 1]["bottom"]
+                    gap = top - lines[i - 1]["bottom"]
                     if gap > 40:
                         confidence += 0.25
                     elif gap > 25:
                         confidence += 0.15
 
                 # Near left margin (within 15% of page width)
-                if line["x0"] < page.width * 0.15:
+                if line["x0"] < left_margin:
                     confidence += 0.1
 
                 # Short line (headings rarely wrap)
@@ -462,26 +581,28 @@ def detect_by_layout(pdf_path: Path) -> DetectionResult | None:
                     confidence += 0.1
 
                 # Near top of page (first 20%)
-                if line["top"] < page_height * 0.2:
+                if top < top_cut:
                     confidence += 0.1
 
                 # Followed by text at different size (if detectable)
-                if i < len(lines) - 1:
-                    next_line = lines[i + 1]
-                    if next_line.get("size", 12) < line.get("size", 12) * 0.9:
-                        confidence += 0.15
-
-                # Exclude likely page numbers, headers, footers
-                if _is_page_number(text) or line["top"] > page_height * 0.9:
-                    confidence = 0.0
+                if i < last and lines[i + 1]["size"] < line["size"] * 0.9:
+                    confidence += 0.15
 
                 if confidence >= 0.35:
+                    confidence = min(confidence, 0.50)
+                    # A repeated title (e.g. a running header) is dropped by
+                    # _filter_noise unless it outscores every earlier copy,
+                    # so skip building those sections at all
+                    key = text.lower()
+                    if best_confidence.get(key, -1.0) >= confidence:
+                        continue
+                    best_confidence[key] = confidence
                     sections.append(
                         Section(
                             title=text,
                             page_start=page_num,
                             level=1,
-                            confidence=min(confidence, 0.50),
+                            confidence=confidence,
                         )
                     )
 
@@ -500,47 +621,62 @@ def detect_by_layout(pdf_path: Path) -> DetectionResult | None:
 
 def _extract_lines_with_positions(page) -> list[dict]:
     """Extract lines with position info from a pdfplumber page."""
-    lines = []
+    lines: list[dict] = []
 
     if not page.chars:
         return lines
 
-    current_line = {
-        "text": "",
-        "size": 0,
-        "top": 0,
-        "bottom": 0,
-        "x0": 0,
-    }
+    # Current line state is kept in locals and the text in a parts list, so
+    # each char costs a few comparisons instead of dict updates and a str copy
+    parts: list[str] = []
+    size = top = bottom = x0 = 0
 
-    chars = sorted(page.chars, key=lambda c: (c["top"], c["x0"]))
+    # Reading order: top to bottom, then left to right
+    chars = sorted(page.chars, key=_CHAR_ORDER)
 
     for char in chars:
+        text = char.get("text", "")
         # New line detection (vertical gap)
-        if current_line["text"] and (char["top"] - current_line["top"]) > 5:
-            if current_line["text"].strip():
-                lines.append(current_line)
-            current_line = {
-                "text": char.get("text", ""),
-                "size": char.get("size", 12),
-                "top": char["top"],
-                "bottom": char["bottom"],
-                "x0": char["x0"],
-            }
+        if parts and (char["top"] - top) > 5:
+            line_text = "".join(parts)
+            if line_text.strip():
+                lines.append(
+                    {
+                        "text": line_text,
+                        "size": size,
+                        "top": top,
+                        "bottom": bottom,
+                        "x0": x0,
+                    }
+                )
+            parts = [text] if text else []
+            size = char.get("size", 12)
+            top = char["top"]
+            bottom = char["bottom"]
+            x0 = char["x0"]
         else:
-            current_line["text"] += char.get("text", "")
-            current_line["bottom"] = max(
-                current_line.get("bottom", 0), char.get("bottom", 0)
-            )
-            if char.get("size", 0) > current_line["size"]:
-                current_line["size"] = char["size"]
-
-    if current_line["text"].strip():
-        lines.append(current_line)
+            if text:
+                parts.append(text)
+            char_bottom = char.get("bottom", 0)
+            if char_bottom > bottom:
+                bottom = char_bottom
+            char_size = char.get("size", 0)
+            if char_size > size:
+                size = char_size
+
+    line_text = "".join(parts)
+    if line_text.strip():
+        lines.append(
+            {"text": line_text, "size": size, "top": top, "bottom": bottom, "x0": x0}
+        )
 
     return lines
 
 
+_ROMAN_PAGE_RE = re.compile(r"^[ivxlc]+$", re.IGNORECASE)
+_PAGE_LABEL_RE = re.compile(r"^page\s+\d+$", re.IGNORECASE)
+
+
 def _is_page_number(text: str) -> bool:
     """Check if text is likely a page number."""
     text = text.strip()
@@ -548,14 +684,28 @@ def _is_page_number(text: str) -> bool:
     if text.isdigit():
         return True
     # Roman numerals (common for front matter)
-    if re.match(r"^[ivxlc]+$", text.lower()):
+    if _ROMAN_PAGE_RE.match(text):
         return True
     # "Page X" format
-    if re.match(r"^page\s+\d+$", text.lower()):
+    if _PAGE_LABEL_RE.match(text):
         return True
     return False
 
 
+# Front/back matter titles that low-confidence layers often mistake for sections
+_FALSE_POSITIVE_TITLES = frozenset(
+    {
+        "contents",
+        "index",
+        "bibliography",
+        "references",
+        "acknowledgments",
+        "about the author",
+        "copyright",
+    }
+)
+
+
 def _filter_noise(sections: list[Section]) -> list[Section]:
     """Remove noisy detections."""
     filtered = []
@@ -577,16 +727,7 @@ def _filter_noise(sections: list[Section]) -> list[Section]:
             continue
 
         # Skip common false positives
-        false_positives = {
-            "contents",
-            "index",
-            "bibliography",
-            "references",
-            "acknowledgments",
-            "about the author",
-            "copyright",
-        }
-        if title_lower in false_positives and section.confidence < 0.5:
+        if title_lower in _FALSE_POSITIVE_TITLES and section.confidence < 0.5:
             continue
 
         seen_titles.add(title_lower)
@@ -610,24 +751,25 @@ def _validate_section_distribution(
         return True  # Too few sections to validate distribution
 
     # Calculate word counts for each section
-    with pdfplumber.open(str(pdf_path)) as pdf:
+    with _open_plumber(pdf_path) as pdf:
         word_counts = []
-        for i, section in enumerate(sections):
-            page_start = section.page_start or 0
-            if section.page_end is not None:
-                page_end = section.page_end
-            elif i + 1 < len(sections):
-                page_end = max(page_start, (sections[i + 1].page_start or page_start) - 1)
-            else:
-                page_end = len(pdf.pages) - 1
-
-            # Extract text and count words
-            text_parts = []
-            for page_num in range(page_start, min(page_end + 1, len(pdf.pages))):
-                text_parts.append(pdf.pages[page_num].extract_text() or "")
-            word_count = len(" ".join(text_parts).split())
+        substantial = 0
+        for page_start, page_end in _section_page_ranges(sections, len(pdf.pages)):
+            # Extract text and count words page by page, without joining
+            # the section's pages into one string first
+            word_count = sum(
+                len((page.extract_text() or "").split())
+                for page in pdf.pages[page_start : page_end + 1]
+            )
             word_counts.append(word_count)
 
+            # Once enough sections have real content, the tiny-section
+            # condition below can no longer hold; skip the remaining pages
+            if word_count >= min_word_threshold:
+                substantial += 1
+                if (len(sections) - substantial) / len(sections) <= 0.6:
+                    return True
+
     total_words = sum(word_counts)
     if total_words == 0:
         return True  # No content to validate
@@ -663,8 +805,7 @@ def chunk_by_pages(pdf_path: Path, pages_per_chunk: int = 10) -> DetectionResult
 
     Used when all detection layers fail.
     """
-    reader = pypdf.PdfReader(str(pdf_path))
-    total_pages = len(reader.pages)
+    total_pages = len(_open_reader(pdf_path).pages)
 
     sections: list[Section] = []
     chunk_num = 1
@@ -695,6 +836,26 @@ def chunk_by_pages(pdf_path: Path, pages_per_chunk: int = 10) -> DetectionResult
 # =============================================================================
 
 
+def _section_page_ranges(
+    sections: list[Section], total_pages: int
+) -> list[tuple[int, int]]:
+    """Resolve the (start, end) page range of each section, in one pass."""
+    ranges = []
+    for i, section in enumerate(sections):
+        page_start = section.page_start or 0
+        if section.page_end is not None:
+            page_end = section.page_end
+        elif i + 1 < len(sections):
+            # End at next section's start
+            next_start = sections[i + 1].page_start or page_start
+            page_end = max(page_start, next_start - 1)
+        else:
+            # Last section: go to end of document
+            page_end = total_pages - 1
+        ranges.append((page_start, page_end))
+    return ranges
+
+
 def _dedupe_sections(sections: list[Section]) -> list[Section]:
     """Remove duplicate sections based on title and page."""
     seen = set()
@@ -757,47 +918,60 @@ DETECTION_LAYERS: list[CascadeLayer] = [
 ]
 
 
-def detect_sections(pdf_path: Path) -> DetectionResult:
-    """
-    Run cascade detection with early termination.
-    Returns first reliable result or falls back to page chunks.
-    """
-    for layer in DETECTION_LAYERS:
-        log.info(f"Trying detection layer: {layer.name} ({layer.description})")
-
-        try:
-            result = layer.fn(pdf_path)
-        except Exception as e:
-            log.warning(f"Layer {layer.name} failed with error: {e}")
-            continue
+def _check_layer(layer: CascadeLayer, pdf_path: Path) -> DetectionResult | None:
+    """Run one cascade layer and return its result if detection stops here."""
+    log.info(f"Trying detection layer: {layer.name} ({layer.description})")
 
-        if result is None:
-            log.info(f"  Layer {layer.name}: No results")
-            continue
+    try:
+        result = layer.fn(pdf_path)
+    except Exception as e:
+        log.warning(f"Layer {layer.name} failed with error: {e}")
+        return None
 
-        if result.confidence >= layer.min_confidence:
-            # Validate word distribution before accepting result
-            if not _validate_section_distribution(result.sections, pdf_path):
-                log.warning(
-                    f"  Layer {layer.name}: Suspicious word distribution - "
-                    f"falling back to next layer"
-                )
-                continue  # Try next detection layer
+    if result is None:
+        log.info(f"  Layer {layer.name}: No results")
+        return None
 
-            log.info(
-                f"  Layer {layer.name}: SUCCESS - "
-                f"{len(result.sections)} sections, "
-                f"confidence={result.confidence:.2f}"
+    if result.confidence >= layer.min_confidence:
+        # Validate word distribution before accepting result; only an
+        # early-exit layer's result can be returned, so others skip the walk
+        if layer.early_exit and not _validate_section_distribution(
+            result.sections, pdf_path
+        ):
+            log.warning(
+                f"  Layer {layer.name}: Suspicious word distribution - "
+                f"falling back to next layer"
             )
+            return None  # Try next detection layer
+
+        log.info(
+            f"  Layer {layer.name}: SUCCESS - "
+            f"{len(result.sections)} sections, "
+            f"confidence={result.confidence:.2f}"
+        )
 
-            if layer.early_exit:
-                log.info(f"  Early exit triggered at layer: {layer.name}")
+        if layer.early_exit:
+            log.info(f"  Early exit triggered at layer: {layer.name}")
+            return result
+    else:
+        log.info(
+            f"  Layer {layer.name}: Below threshold - "
+            f"confidence={result.confidence:.2f} < {layer.min_confidence}"
+        )
+    return None
+
+
+def detect_sections(pdf_path: Path) -> DetectionResult:
+    """
+    Run cascade detection with early termination.
+    Returns first reliable result or falls back to page chunks.
+    """
+    # Layers and validation share one pdfplumber document
+    with _share_plumber(pdf_path):
+        for layer in DETECTION_LAYERS:
+            result = _check_layer(layer, pdf_path)
+            if result is not None:
                 return result
-        else:
-            log.info(
-                f"  Layer {layer.name}: Below threshold - "
-                f"confidence={result.confidence:.2f} < {layer.min_confidence}"
-            )
 
     # All layers exhausted, use fallback
     log.warning("All detection layers failed. Using page-based chunking.")
@@ -818,7 +992,7 @@ class PdfParser(BookParser):
         self._pages_per_chunk = pages_per_chunk
 
         try:
-            self._reader = pypdf.PdfReader(str(pdf_path))
+            self._reader = _open_reader(pdf_path)
         except FileNotDecryptedError:
             raise ValueError("PDF is encrypted. Please decrypt first.")
         except EmptyFileError:
@@ -911,11 +1085,7 @@ class PdfParser(BookParser):
 
     def _extract_sample_text(self) -> str:
         """Extract sample text to detect scanned PDFs."""
-        sample_pages = min(5, len(self._reader.pages))
-        text_parts = []
-        for i in range(sample_pages):
-            text_parts.append(self._reader.pages[i].extract_text() or "")
-        return " ".join(text_parts)
+        return " ".join(_extract_pages_text(self.path)[:5])
 
     def _build_toc(self) -> list[TOCEntry]:
         """Build TOC from detected sections."""
@@ -942,22 +1112,13 @@ class PdfParser(BookParser):
 
         chapters = []
         sections = self._detection_result.sections
+        page_ranges = _section_page_ranges(sections, len(self._reader.pages))
 
-        for i, section in enumerate(sections):
-            # Determine page range
-            page_start = section.page_start or 0
-            if section.page_end is not None:
-                page_end = section.page_end
-            elif i + 1 < len(sections):
-                # End at next section's start
-                next_start = sections[i + 1].page_start or page_start
-                page_end = max(page_start, next_start - 1)
-            else:
-                # Last section: go to end of document
-                page_end = len(self._reader.pages) - 1
-
+        for i, (section, (page_start, page_end)) in enumerate(
+            zip(sections, page_ranges)
+        ):
             # Extract text content
-            content = self._extract_page_range(page_start, page_end)
+            pages_text = self._extract_page_range(page_start, page_end)
 
             chapters.append(
                 Chapter(
@@ -965,8 +1126,8 @@ class PdfParser(BookParser):
                     title=section.title,
                     index=i,
                     file_name=f"pages_{page_start + 1}-{page_end + 1}",
-                    raw_content=content.encode("utf-8"),
-                    word_count=len(content.split()),
+                    raw_content="\n\n".join(pages_text).encode("utf-8"),
+                    word_count=sum(len(text.split()) for text in pages_text),
                     has_images=False,  # TODO: Image detection
                     page_start=page_start,
                     page_end=page_end,
@@ -978,11 +1139,6 @@ class PdfParser(BookParser):
 
         return chapters
 
-    def _extract_page_range(self, start: int, end: int) -> str:
-        """Extract text from a range of pages."""
-        text_parts = []
-        for page_num in range(start, end + 1):
-            if page_num < len(self._reader.pages):
-                page = self._reader.pages[page_num]
-                text_parts.append(page.extract_text() or "")
-        return "\n\n".join(text_parts)
+    def _extract_page_range(self, start: int, end: int) -> tuple[str, ...]:
+        """Extract the text of each page in a range."""
+        return _extract_pages_text(self.path)[start : end + 1]
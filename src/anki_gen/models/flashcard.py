@@ -2,9 +2,28 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 
+# Tags that are already lowercase, hyphen-separated alphanumerics
+_CLEAN_TAG_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# Space-separated run of such tags
+_CLEAN_TAGS_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*(?: +[a-z0-9]+(?:-[a-z0-9]+)*)*")
+
+# Patterns for deck name sanitization
+_SPACED_CHARS_RE = re.compile(r"[\x00-\x1f\x7f-\x9f/|]")
+_HIERARCHY_SEP_RE = re.compile(r"::")
+_UNSAFE_CHARS_RE = re.compile(r'[<>:"\\?*]')
+_SPACES_RE = re.compile(r" +")
+# A run of non-alphanumerics containing a separator; the whole run becomes
+# one hyphen (slugs separate on whitespace, "_" and "-"; tags on whitespace
+# and "-")
+_SLUG_SEP_RUN_RE = re.compile(r"[^a-z0-9]*[\s_-][^a-z0-9]*")
+_TAG_SEP_RUN_RE = re.compile(r"[^a-z0-9]*[\s-][^a-z0-9]*")
+# Whatever is left besides alphanumerics and those hyphens
+_NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9-]+")
+
 
 class BasicCard(BaseModel):
     """Basic Q&A flashcard."""
@@ -56,44 +75,52 @@ class AnkiExportConfig(BaseModel):
         - File system unsafe characters
         - Anki field separator (|)
         """
-        # Replace control characters with space
-        sanitized = re.sub(r"[\x00-\x1f\x7f-\x9f]", " ", name)
+        # Replace control characters and separator-like characters (to avoid
+        # run-on words) with space
+        sanitized = _SPACED_CHARS_RE.sub(" ", name)
         # Replace :: (Anki hierarchy separator) with dash
-        sanitized = re.sub(r"::", "-", sanitized)
-        # Replace separator-like characters with space (to avoid run-on words)
-        sanitized = re.sub(r"[/|]", " ", sanitized)
+        sanitized = _HIERARCHY_SEP_RE.sub("-", sanitized)
         # Remove other problematic characters (file system / Anki unsafe)
-        sanitized = re.sub(r'[<>:"\\?*]', "", sanitized)
+        sanitized = _UNSAFE_CHARS_RE.sub("", sanitized)
         # Collapse multiple spaces
-        sanitized = re.sub(r" +", " ", sanitized)
+        sanitized = _SPACES_RE.sub(" ", sanitized)
         return sanitized.strip()
 
     @staticmethod
     def slugify(text: str) -> str:
         """Convert text to lowercase slug with hyphens."""
-        # Lowercase
-        slug = text.lower()
-        # Replace spaces and underscores with hyphens
-        slug = re.sub(r"[\s_]+", "-", slug)
-        # Remove non-alphanumeric except hyphens
-        slug = re.sub(r"[^a-z0-9-]", "", slug)
-        # Remove multiple consecutive hyphens
-        slug = re.sub(r"-+", "-", slug)
+        # Lowercase, then turn each run of spaces, underscores and hyphens
+        # (with any other symbols in it) into a single hyphen
+        slug = _SLUG_SEP_RUN_RE.sub("-", text.lower())
+        # Remove remaining non-alphanumeric characters
+        slug = _NON_SLUG_CHARS_RE.sub("", slug)
         return slug.strip("-")
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def sanitize_tag(tag: str) -> str:
-        """Sanitize a single tag for Anki compatibility."""
-        # Lowercase
-        sanitized = tag.lower()
-        # Replace spaces with hyphens
-        sanitized = re.sub(r"\s+", "-", sanitized)
-        # Remove non-alphanumeric except hyphens
-        sanitized = re.sub(r"[^a-z0-9-]", "", sanitized)
-        # Remove multiple consecutive hyphens
-        sanitized = re.sub(r"-+", "-", sanitized)
+        """Sanitize a single tag for Anki compatibility.
+
+        Cached since cards in a chapter mostly share the same few tags.
+        """
+        # Fast path: the prompt asks for clean tags, so most need no changes
+        if _CLEAN_TAG_RE.fullmatch(tag):
+            return tag
+        # Lowercase, then turn each run of spaces and hyphens (with any other
+        # symbols in it) into a single hyphen
+        sanitized = _TAG_SEP_RUN_RE.sub("-", tag.lower())
+        # Remove remaining non-alphanumeric characters
+        sanitized = _NON_SLUG_CHARS_RE.sub("", sanitized)
         return sanitized.strip("-")
 
+    @staticmethod
+    def sanitize_tags(raw_tags: str) -> list[str]:
+        """Split a space-separated tag string and sanitize each tag."""
+        # Fast path: one match for the whole string when every tag is clean
+        if _CLEAN_TAGS_RE.fullmatch(raw_tags):
+            return raw_tags.split()
+        return [AnkiExportConfig.sanitize_tag(t) for t in raw_tags.split()]
+
     @staticmethod
     def escape_field(field: str, separator: str = "|") -> str:
         """Escape a field for Anki's CSV import format.
@@ -125,42 +152,38 @@ class GenerationResult(BaseModel):
 
     def to_combined_txt(self, config: AnkiExportConfig) -> str:
         """Export all cards as single Anki-importable file with headers."""
+        sanitize_tag = AnkiExportConfig.sanitize_tag
+        escape = AnkiExportConfig.escape_field
+
+        tags_header = f"#tags:anki-gen {config.book_slug}"
+        # Add global tags if specified
+        if config.global_tags:
+            sanitized_global = " ".join(map(sanitize_tag, config.global_tags))
+            tags_header = f"{tags_header} {sanitized_global}"
+
         # Build file headers
         lines = [
             "#separator:Pipe",
             "#html:true",
             f"#deck:{config.deck_name}",
-            f"#tags:anki-gen {config.book_slug}",
+            tags_header,
             "#notetype column:1",
             "#tags column:4",
             "#guid column:5",
             "#columns:Note Type|Field 1|Field 2|Tags|GUID",
         ]
 
-        # Add global tags if specified
-        if config.global_tags:
-            sanitized_global = " ".join(
-                AnkiExportConfig.sanitize_tag(t) for t in config.global_tags
-            )
-            lines[3] = f"#tags:anki-gen {config.book_slug} {sanitized_global}"
-
-        # Add all cards (basic first, then cloze)
-        for card in self.basic_cards:
-            tags_str = " ".join(
-                AnkiExportConfig.sanitize_tag(t) for t in card.tags
-            )
-            # Escape fields containing pipes or quotes (per Anki docs)
-            front = AnkiExportConfig.escape_field(card.front)
-            back = AnkiExportConfig.escape_field(card.back)
-            lines.append(f"Basic|{front}|{back}|{tags_str}|{card.guid}")
-
-        for card in self.cloze_cards:
-            tags_str = " ".join(
-                AnkiExportConfig.sanitize_tag(t) for t in card.tags
-            )
-            # Escape fields containing pipes or quotes (per Anki docs)
-            text = AnkiExportConfig.escape_field(card.text)
-            back_extra = AnkiExportConfig.escape_field(card.back_extra)
-            lines.append(f"Cloze|{text}|{back_extra}|{tags_str}|{card.guid}")
+        # Add all cards (basic first, then cloze), escaping fields containing
+        # pipes or quotes (per Anki docs)
+        lines.extend(
+            f"Basic|{escape(c.front)}|{escape(c.back)}|"
+            f"{' '.join(map(sanitize_tag, c.tags))}|{c.guid}"
+            for c in self.basic_cards
+        )
+        lines.extend(
+            f"Cloze|{escape(c.text)}|{escape(c.back_extra)}|"
+            f"{' '.join(map(sanitize_tag, c.tags))}|{c.guid}"
+            for c in self.cloze_cards
+        )
 
         return "\n".join(lines)
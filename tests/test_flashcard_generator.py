@@ -0,0 +1,103 @@
+"""Tests for flashcard generation."""
+
+import io
+import os
+import signal
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from anki_gen.core.flashcard_generator import FlashcardGenerator
+from anki_gen.models.output import ChapterMetadata, ChapterOutput
+
+
+def make_chapter(title: str, content: str) -> ChapterOutput:
+    return ChapterOutput(
+        metadata=ChapterMetadata(
+            chapter_id="c",
+            chapter_index=0,
+            title=title,
+            source_file="f",
+            source_path="p",
+            word_count=len(content.split()),
+            character_count=len(content),
+            paragraph_count=1,
+        ),
+        content=content,
+    )
+
+
+def count_gemini_calls(
+    generator: FlashcardGenerator, monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    prompts: list[str] = []
+
+    def fake_call(prompt: str, on_line: object = None) -> str:
+        prompts.append(prompt)
+        return "Basic|Question?|Answer|tag"
+
+    monkeypatch.setattr(generator, "_call_gemini", fake_call)
+    return prompts
+
+
+def test_response_reused_for_whitespace_only_differences(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generator = FlashcardGenerator()
+    prompts = count_gemini_calls(generator, monkeypatch)
+
+    generator.generate(make_chapter("Intro", "The  NASA\nmission"), "chapter_001.json")
+    generator.generate(make_chapter("Intro", "The NASA mission"), "chapter_002.json")
+
+    assert len(prompts) == 1
+
+
+def test_response_not_reused_across_case_or_title_differences(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generator = FlashcardGenerator()
+    prompts = count_gemini_calls(generator, monkeypatch)
+
+    generator.generate(make_chapter("Intro", "The NASA mission"), "chapter_001.json")
+    generator.generate(make_chapter("Intro", "The nasa mission"), "chapter_002.json")
+    generator.generate(make_chapter("Summary", "The NASA mission"), "chapter_003.json")
+
+    assert len(prompts) == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Streaming uses a pty")
+def test_streaming_returns_when_child_keeps_pty_open(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The CLI exiting ends the stream even if a child still holds the pty."""
+    pid_file = tmp_path / "child.pid"
+    gemini = tmp_path / "gemini"
+    gemini.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import subprocess
+            # Inherits stdout/stderr, i.e. the pty, and outlives this process
+            child = subprocess.Popen(["sleep", "30"])
+            with open({str(pid_file)!r}, "w") as f:
+                f.write(str(child.pid))
+            print("Basic|What is the capital of France?|Paris|geography")
+            """
+        )
+    )
+    gemini.chmod(gemini.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    generator = FlashcardGenerator(console=Console(file=io.StringIO()))
+    generator.IDLE_TIMEOUT_SECONDS = 5
+    try:
+        response = generator._call_gemini_streaming("prompt")
+    finally:
+        if pid_file.exists():
+            os.kill(int(pid_file.read_text()), signal.SIGTERM)
+
+    assert "Basic|What is the capital of France?|Paris|geography" in response